@@ -13,6 +13,28 @@ import random
 import numpy as np
 from typing import List, Tuple, Dict, Optional
 import time
+import logging
+import sys
+
+# Journal des événements fréquents (vols de lignes) : silencieux par défaut, contrairement à print
+logger = logging.getLogger(__name__)
+
+# Compilation JIT optionnelle : sans Numba, les noyaux s'exécutent en Python pur
+try:
+    from numba import njit
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+    
+    def njit(*args, **kwargs):
+        """Remplaçant de numba.njit qui retourne la fonction inchangée."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Cache disque des noyaux compilés : Numba le place à côté du fichier source, absent d'un
+# exécutable PyInstaller (modules archivés sans .py) où le cache lèverait une erreur à l'import
+CACHE_NUMBA = not getattr(sys, 'frozen', False)
 
 
 class SoundManager:
@@ -470,73 +492,374 @@ class Config:
         return 80  # Zone UI très compacte - juste titre et timer
 
 
+@njit(cache=CACHE_NUMBA, fastmath=True, inline='always')
+def _fade(t: float) -> float:
+    """Fonction de lissage."""
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+@njit(cache=CACHE_NUMBA, fastmath=True, inline='always')
+def _lerp(a: float, b: float, t: float) -> float:
+    """Interpolation linéaire."""
+    return a + t * (b - a)
+
+
+@njit(cache=CACHE_NUMBA, fastmath=True, inline='always')
+def _grad(hash_val: int, x: float, y: float) -> float:
+    """Calcul du gradient."""
+    h = hash_val & 15
+    u = x if h < 8 else y
+    v = y if h < 4 else (x if h == 12 or h == 14 else 0.0)
+    return (u if (h & 1) == 0 else -u) + (v if (h & 2) == 0 else -v)
+
+
+@njit(cache=CACHE_NUMBA, fastmath=True, inline='always')
+def _hash2(a: int, b: int, seed: int) -> int:
+    """Hachage entier 32 bits d'un coin de cellule (remplace la table de permutation)."""
+    h = ((a * 0x27d4eb2d) ^ b ^ seed) & 0xFFFFFFFF
+    h ^= h >> 15
+    h = (h * 0x85ebca6b) & 0xFFFFFFFF
+    h ^= h >> 13
+    return h
+
+
+@njit(cache=CACHE_NUMBA, fastmath=True)
+def _noise2d(seed: int, x: float, y: float) -> float:
+    """Bruit de Perlin 2D avec gradients choisis par hachage des coins."""
+    # Coordonnées de la cellule
+    X = int(x)
+    Y = int(y)
+    
+    # Position relative dans la cellule
+    x -= X
+    y -= Y
+    
+    # Courbes de lissage
+    u = _fade(x)
+    v = _fade(y)
+    
+    # Hachage des coordonnées des 4 coins de la cellule
+    AA = _hash2(X, Y, seed)
+    BA = _hash2(X + 1, Y, seed)
+    AB = _hash2(X, Y + 1, seed)
+    BB = _hash2(X + 1, Y + 1, seed)
+    
+    # Interpolation
+    return _lerp(
+        _lerp(_grad(AA, x, y),
+              _grad(BA, x - 1, y), u),
+        _lerp(_grad(AB, x, y - 1),
+              _grad(BB, x - 1, y - 1), u), v)
+
+
 class SimplexNoise:
     """Implémentation simple du bruit de Perlin pour le mouvement des joueurs."""
     
-    def __init__(self, seed: int = None):
-        if seed is not None:
-            random.seed(seed)
-        
-        # Génération de la table de permutation
-        self.perm = list(range(256))
-        random.shuffle(self.perm)
-        self.perm += self.perm  # Doubler pour éviter les débordements
-    
-    def fade(self, t: float) -> float:
-        """Fonction de lissage."""
-        return t * t * t * (t * (t * 6 - 15) + 10)
-    
-    def lerp(self, a: float, b: float, t: float) -> float:
-        """Interpolation linéaire."""
-        return a + t * (b - a)
+    __slots__ = ('seed',)
     
-    def grad(self, hash_val: int, x: float, y: float) -> float:
-        """Calcul du gradient."""
-        h = hash_val & 15
-        u = x if h < 8 else y
-        v = y if h < 4 else (x if h == 12 or h == 14 else 0)
-        return (u if (h & 1) == 0 else -u) + (v if (h & 2) == 0 else -v)
+    def __init__(self, seed: int = None):
+        # Graine mélangée au hachage des coins (aucune table à générer)
+        self.seed = (seed if seed is not None else random.getrandbits(32)) & 0xFFFFFFFF
     
     def noise(self, x: float, y: float) -> float:
         """Génère le bruit de Perlin en 2D."""
-        # Coordonnées de la cellule
-        X = int(x) & 255
-        Y = int(y) & 255
-        
-        # Position relative dans la cellule
-        x -= int(x)
-        y -= int(y)
-        
-        # Courbes de lissage
-        u = self.fade(x)
-        v = self.fade(y)
-        
-        # Hachage des coordonnées des 4 coins de la cellule
-        A = self.perm[X] + Y
-        AA = self.perm[A]
-        AB = self.perm[A + 1]
-        B = self.perm[X + 1] + Y
-        BA = self.perm[B]
-        BB = self.perm[B + 1]
-        
-        # Interpolation
-        res = self.lerp(
-            self.lerp(self.grad(self.perm[AA], x, y),
-                     self.grad(self.perm[BA], x - 1, y), u),
-            self.lerp(self.grad(self.perm[AB], x, y - 1),
-                     self.grad(self.perm[BB], x - 1, y - 1), u), v)
-        
-        return res
+        return _noise2d(self.seed, x, y)
 
 
-# Instance globale du générateur de bruit
-noise_generator = SimplexNoise()
+@njit(cache=CACHE_NUMBA, fastmath=True)
+def _physics_step(pos: np.ndarray, vel: np.ndarray, prev: np.ndarray, noise_time: np.ndarray,
+                  noise_offsets: np.ndarray, noise_seeds: np.ndarray, radii: np.ndarray, active: np.ndarray,
+                  center_x: float, center_y: float, circle_radius: float,
+                  target_pos: np.ndarray, target_buckets: np.ndarray, bucket_size: float,
+                  dt: float, params: np.ndarray, hits: np.ndarray):
+    """
+    Pas de physique complet de tous les joueurs, fusionné en un seul noyau.
+    
+    Enchaîne le mouvement de chaque joueur actif (bruit, vitesse minimale, répulsion,
+    vitesse maximale, rebond sur le bord), les collisions entre joueurs puis la
+    recherche des cibles touchées. Les effets de jeu (score, sons, messages) restent
+    côté Python.
+    
+    Args:
+        params: [VITESSE_MOUVEMENT_JOUEUR, AMPLITUDE_BRUIT_POSITION,
+                 FORCE_REPULSION_JOUEURS, VITESSE_MAX_JOUEUR, COEFFICIENT_REBOND]
+        hits: Tampon de sortie (P * largeur des secteurs, 2) des paires (joueur, cible)
+              touchées, remplies dans l'ordre joueur puis cible
+    
+    Returns:
+        (nombre de rebonds sur le bord, nombre de collisions entre joueurs,
+         nombre de paires écrites dans hits)
+    """
+    speed_factor = params[0]
+    noise_amplitude = params[1]
+    repulsion = params[2]
+    max_speed = params[3]
+    bounce = params[4]
+    num_players = pos.shape[0]
+    border_hits = 0
+    
+    # 1. Mouvement des joueurs, dans l'ordre : la répulsion voit les positions déjà mises à jour
+    for i in range(num_players):
+        # Ne pas mettre à jour les joueurs éliminés
+        if not active[i]:
+            continue
+        x = float(pos[i, 0])
+        y = float(pos[i, 1])
+        vx = float(vel[i, 0])
+        vy = float(vel[i, 1])
+        radius = float(radii[i])
+        
+        t = noise_time[i] + dt * speed_factor
+        noise_time[i] = t
+        
+        # Forces de bruit de Perlin (générateur individuel du joueur)
+        seed = int(noise_seeds[i])
+        ox = noise_offsets[i, 0]
+        oy = noise_offsets[i, 1]
+        noise_x = _noise2d(seed, ox + t, oy)
+        noise_y = _noise2d(seed, ox, oy + t)
+        
+        # Réduire l'influence du bruit au début du jeu pour éviter les ralentissements
+        noise_influence = 0.05 if t < 20 else 0.15
+        vx += noise_x * noise_amplitude * dt * noise_influence
+        vy += noise_y * noise_amplitude * dt * noise_influence
+        
+        # Vitesse minimale qui augmente avec le temps pour éviter tout ralentissement
+        # (test au carré : la racine n'est prise que pour renormaliser)
+        speed_sq = vx * vx + vy * vy
+        min_speed = 120.0 + t * 3.0
+        if speed_sq < min_speed * min_speed:
+            if speed_sq > 0:
+                current_speed = math.sqrt(speed_sq)
+                vx = (vx / current_speed) * min_speed
+                vy = (vy / current_speed) * min_speed
+            else:
+                # Si complètement arrêté, repartir vers le centre
+                dx_to_center = center_x - x
+                dy_to_center = center_y - y
+                distance_to_center = math.hypot(dx_to_center, dy_to_center)
+                if distance_to_center > 0:
+                    vx = (dx_to_center / distance_to_center) * min_speed
+                    vy = (dy_to_center / distance_to_center) * min_speed
+                else:
+                    angle = random.uniform(0, 2 * math.pi)
+                    vx = math.cos(angle) * min_speed
+                    vy = math.sin(angle) * min_speed
+        else:
+            # Micro-accélération constante de 0.1% par frame
+            vx *= 1.001
+            vy *= 1.001
+        
+        # Répulsion entre joueurs (3x plus forte, accélération x2.5)
+        for j in range(num_players):
+            if j == i:
+                continue
+            # Rejet rapide par boîte englobante : la plupart des paires sont loin l'une de l'autre
+            min_distance = (radius + float(radii[j])) * 2.5
+            dx = x - float(pos[j, 0])
+            if abs(dx) >= min_distance:
+                continue
+            dy = y - float(pos[j, 1])
+            if abs(dy) >= min_distance:
+                continue
+            distance_sq = dx * dx + dy * dy
+            # Comparaison au carré : la racine n'est calculée que pour les joueurs proches
+            if distance_sq < min_distance * min_distance and distance_sq > 0:
+                # Force (3 * F / d²) le long de (dx, dy) / d : un seul facteur en d^-3
+                scale = (repulsion * 3) * dt * 2.5 / (distance_sq * math.sqrt(distance_sq))
+                vx += dx * scale
+                vy += dy * scale
+        
+        # Limiter la vitesse maximum
+        speed_sq = vx * vx + vy * vy
+        if speed_sq > max_speed * max_speed:
+            factor = max_speed / math.sqrt(speed_sq)
+            vx *= factor
+            vy *= factor
+        
+        new_x = x + vx * dt
+        new_y = y + vy * dt
+        
+        # Collision avec les parois du cercle (rebond un demi-rayon avant le bord)
+        dx = new_x - center_x
+        dy = new_y - center_y
+        distance_from_center_sq = dx * dx + dy * dy
+        max_distance = circle_radius - radius * 0.5
+        # Comparaison au carré : la racine n'est calculée qu'en cas de rebond
+        if distance_from_center_sq > max_distance * max_distance:
+            border_hits += 1
+            distance_from_center = math.sqrt(distance_from_center_sq)
+            
+            # Direction unitaire vers le centre, tournée de ±20° par une rotation 2x2
+            # (pas d'atan2 : seul l'angle de variation passe par cos/sin)
+            normal_x = -dx / distance_from_center
+            normal_y = -dy / distance_from_center
+            variation = math.radians(random.uniform(-20, 20))
+            cos_v = math.cos(variation)
+            sin_v = math.sin(variation)
+            
+            # Rebond énergique : jamais de ralentissement, +30% de vitesse
+            current_speed = math.hypot(vx, vy)
+            boosted_speed = current_speed * bounce * random.uniform(1.0, 1.4) * 1.3
+            vx = (cos_v * normal_x - sin_v * normal_y) * boosted_speed
+            vy = (sin_v * normal_x + cos_v * normal_y) * boosted_speed
+            
+            # Repositionner le joueur à la limite
+            factor = max_distance / distance_from_center
+            new_x = center_x + dx * factor
+            new_y = center_y + dy * factor
+        
+        prev[i, 0] = x
+        prev[i, 1] = y
+        pos[i, 0] = new_x
+        pos[i, 1] = new_y
+        vel[i, 0] = vx
+        vel[i, 1] = vy
+    
+    # 2. Collisions directes entre joueurs actifs - rebond avec directions divergentes
+    collisions = 0
+    for i in range(num_players):
+        if not active[i]:
+            continue
+        for j in range(i + 1, num_players):
+            if not active[j]:
+                continue
+            dx = float(pos[j, 0]) - float(pos[i, 0])
+            dy = float(pos[j, 1]) - float(pos[i, 1])
+            distance_sq = dx * dx + dy * dy
+            min_distance = float(radii[i]) + float(radii[j])
+            if distance_sq < min_distance * min_distance and distance_sq > 0:
+                distance = math.sqrt(distance_sq)
+                collisions += 1
+                collision_angle = math.atan2(dy, dx)
+                
+                # Vitesse moyenne augmentée de 40% pour maintenir l'énergie
+                speed1 = math.hypot(float(vel[i, 0]), float(vel[i, 1]))
+                speed2 = math.hypot(float(vel[j, 0]), float(vel[j, 1]))
+                bounce_speed = (speed1 + speed2) / 2 * 1.4
+                
+                # ~135° et ~45° de l'angle de collision (±25°) : 90° minimum entre les trajectoires
+                rebound_angle1 = collision_angle + math.pi * 0.75 + math.radians(random.uniform(-25, 25))
+                rebound_angle2 = collision_angle + math.pi * 0.25 + math.radians(random.uniform(-25, 25))
+                vel[i, 0] = math.cos(rebound_angle1) * bounce_speed
+                vel[i, 1] = math.sin(rebound_angle1) * bounce_speed
+                vel[j, 0] = math.cos(rebound_angle2) * bounce_speed
+                vel[j, 1] = math.sin(rebound_angle2) * bounce_speed
+                
+                # Séparer les joueurs pour éviter l'interpénétration
+                separation = (min_distance - distance) / 2
+                nx = dx / distance
+                ny = dy / distance
+                pos[i, 0] -= nx * separation
+                pos[i, 1] -= ny * separation
+                pos[j, 0] += nx * separation
+                pos[j, 1] += ny * separation
+    
+    # 3. Cibles touchées : seuls les joueurs proches du bord, et seulement les cibles
+    # de leur secteur angulaire et des secteurs voisins
+    num_hits = 0
+    for i in range(num_players):
+        if not active[i]:
+            continue
+        px = float(pos[i, 0])
+        py = float(pos[i, 1])
+        radius = float(radii[i])
+        dcx = px - center_x
+        dcy = py - center_y
+        band = circle_radius - radius - 1
+        if dcx * dcx + dcy * dcy < band * band:
+            continue
+        theta = math.atan2(dcy, dcx) % (2 * math.pi)
+        bucket = int(theta / bucket_size) % target_buckets.shape[0]
+        for k in range(target_buckets.shape[1]):
+            target_id = target_buckets[bucket, k]
+            if target_id < 0:
+                break
+            dx = px - float(target_pos[target_id, 0])
+            dy = py - float(target_pos[target_id, 1])
+            if dx * dx + dy * dy <= radius * radius:
+                hits[num_hits, 0] = i
+                hits[num_hits, 1] = target_id
+                num_hits += 1
+    
+    return border_hits, collisions, num_hits
+
+
+@njit(cache=CACHE_NUMBA, fastmath=True)
+def _crossed_lines(player_id: int, radius: float, pos: np.ndarray, prev: np.ndarray,
+                   target_pos: np.ndarray, owners: np.ndarray, active: np.ndarray, out: np.ndarray) -> int:
+    """
+    Cibles dont la ligne (propriétaire -> cible) est traversée ou touchée par un joueur.
+    
+    Seules les lignes possédées par d'autres joueurs actifs sont testées. Les indices des
+    cibles sont écrits dans out, dans l'ordre des cibles ; retourne leur nombre.
+    """
+    x1 = float(prev[player_id, 0])
+    y1 = float(prev[player_id, 1])
+    x2 = float(pos[player_id, 0])
+    y2 = float(pos[player_id, 1])
+    radius_sq = radius * radius
+    
+    # Boîte englobante du trajet du joueur élargie de son rayon
+    path_min_x = min(x1, x2) - radius
+    path_max_x = max(x1, x2) + radius
+    path_min_y = min(y1, y2) - radius
+    path_max_y = max(y1, y2) + radius
+    
+    count = 0
+    for target_id in range(owners.shape[0]):
+        owner = owners[target_id]
+        if owner < 0 or owner == player_id or not active[owner]:
+            continue
+        x3 = float(pos[owner, 0])
+        y3 = float(pos[owner, 1])
+        x4 = float(target_pos[target_id, 0])
+        y4 = float(target_pos[target_id, 1])
+        
+        # Phase large : condition nécessaire pour traverser ou toucher la ligne
+        if (min(x3, x4) > path_max_x or max(x3, x4) < path_min_x or
+                min(y3, y4) > path_max_y or max(y3, y4) < path_min_y):
+            continue
+        
+        # Intersection du trajet avec la ligne
+        crossed = False
+        denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+        if abs(denom) >= 1e-10:
+            t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
+            u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denom
+            crossed = 0 <= t <= 1 and 0 <= u <= 1
+        
+        # Sinon, position actuelle assez proche de la ligne pour la toucher
+        if not crossed:
+            dx = x4 - x3
+            dy = y4 - y3
+            length_sq = dx * dx + dy * dy
+            projection = 0.0
+            if length_sq > 0:
+                projection = min(1.0, max(0.0, ((x2 - x3) * dx + (y2 - y3) * dy) / length_sq))
+            cx = x3 + projection * dx - x2
+            cy = y3 + projection * dy - y2
+            crossed = cx * cx + cy * cy <= radius_sq
+        
+        if crossed:
+            out[count] = target_id
+            count += 1
+    return count
 
 
 class Player:
     """Classe représentant un joueur dans la bataille de lignes."""
     
-    def __init__(self, player_id: int, color: Tuple[int, int, int], center_x: float, center_y: float, circle_radius: float, total_players: int = Config.NOMBRE_PARTICIPANTS, sound_manager=None):
+    # Attributs fixes : pas de __dict__ par instance (x, y, vx... sont des propriétés sur les tableaux SoA)
+    __slots__ = ('pos', 'vel', 'prev', '_noise_time', '_power_frames', '_power_reduced',
+                 'id', 'color', 'name', 'score', 'is_eliminated', 'sound_manager',
+                 'center_x', 'center_y', 'circle_radius', 'noise_generator',
+                 'noise_offset_x', 'noise_offset_y', 'radius', 'owned_targets', 'sprites')
+    
+    def __init__(self, player_id: int, color: Tuple[int, int, int], center_x: float, center_y: float, circle_radius: float, total_players: int = Config.NOMBRE_PARTICIPANTS, sound_manager=None,
+                 pos: Optional[np.ndarray] = None, vel: Optional[np.ndarray] = None, prev: Optional[np.ndarray] = None,
+                 noise_time: Optional[np.ndarray] = None, power_frames: Optional[np.ndarray] = None,
+                 power_reduced: Optional[np.ndarray] = None):
         """
         Initialise un joueur.
         
@@ -547,12 +870,22 @@ class Player:
             circle_radius: Rayon du cercle de jeu
             total_players: Nombre total de joueurs (pour le calcul d'angle)
             sound_manager: Gestionnaire de sons pour les effets audio
+            pos, vel, prev: Vues (2,) sur les tableaux SoA du jeu (position, vitesse, position précédente)
+            noise_time: Vue (1,) sur le temps de bruit du joueur dans le tableau SoA du jeu
+            power_frames, power_reduced: Vues (1,) sur l'état de réduction de puissance du jeu
         """
+        # État physique stocké dans les tableaux partagés du jeu (Structure-of-Arrays)
+        self.pos = pos if pos is not None else np.zeros(2, dtype=np.float32)
+        self.vel = vel if vel is not None else np.zeros(2, dtype=np.float32)
+        self.prev = prev if prev is not None else np.zeros(2, dtype=np.float32)
+        self._noise_time = noise_time if noise_time is not None else np.zeros(1, dtype=np.float64)
+        self._power_frames = power_frames if power_frames is not None else np.zeros(1, dtype=np.int16)
+        self._power_reduced = power_reduced if power_reduced is not None else np.zeros(1, dtype=bool)
+        
         self.id = player_id
         self.color = color
         self.name = f"Joueur {player_id + 1}"  # Nom par défaut
         self.score = 0
-        self.power_factor = 1.0  # Facteur de puissance normal
         self.is_eliminated = False  # État d'élimination
         self.sound_manager = sound_manager  # Gestionnaire de sons
         
@@ -575,7 +908,7 @@ class Player:
         # Chaque joueur part de sa position initiale directement vers le centre exact
         dx_to_center = center_x - self.x  # Composante X vers le centre
         dy_to_center = center_y - self.y  # Composante Y vers le centre
-        distance_to_center = math.sqrt(dx_to_center * dx_to_center + dy_to_center * dy_to_center)
+        distance_to_center = math.hypot(dx_to_center, dy_to_center)
         
         # Normaliser le vecteur et appliquer la vitesse initiale vers le centre exact
         initial_speed = 150.0  # Vitesse initiale augmentée pour éviter l'élimination précoce
@@ -600,7 +933,7 @@ class Player:
         # Rayon du joueur
         self.radius = Config.RAYON_JOUEUR
         
-        # État de puissance réduite
+        # État de puissance réduite (facteur de puissance normal)
         self.power_reduction_frames = 0
         self.was_power_reduced = False
         
@@ -608,179 +941,86 @@ class Player:
         self.owned_targets: List[int] = []
         
         # Position précédente pour détecter le franchissement des lignes
-        self.prev_x = self.x
-        self.prev_y = self.y
-        
-    def update_position(self, time_factor: float, other_players: List['Player']):
-        """Met à jour la position du joueur avec physique de rebond."""
-        # Ne pas mettre à jour les joueurs éliminés
-        if self.is_eliminated:
-            return
-            
-        self.noise_time += time_factor * Config.VITESSE_MOUVEMENT_JOUEUR
-        
-        # Forces de bruit de Perlin (plus subtiles maintenant)
-        # Utiliser le générateur de bruit individuel du joueur
-        noise_x = self.noise_generator.noise(
-            self.noise_offset_x + self.noise_time,
-            self.noise_offset_y
-        )
-        noise_y = self.noise_generator.noise(
-            self.noise_offset_x,
-            self.noise_offset_y + self.noise_time
-        )
-        
-        # Appliquer les forces de bruit à la vélocité (encore plus subtiles au début)
-        force_x = noise_x * Config.AMPLITUDE_BRUIT_POSITION
-        force_y = noise_y * Config.AMPLITUDE_BRUIT_POSITION
-        
-        # Réduire l'influence du bruit au début du jeu pour éviter les ralentissements
-        noise_influence = 0.05 if self.noise_time < 20 else 0.15  # Très faible au début
-        self.vx += force_x * time_factor * noise_influence
-        self.vy += force_y * time_factor * noise_influence
-        
-        # Empêcher le ralentissement - les joueurs accélèrent constamment
-        current_speed = math.sqrt(self.vx * self.vx + self.vy * self.vy)
-        
-        # Vitesse minimale qui augmente avec le temps pour éviter tout ralentissement
-        base_min_speed = 120.0  # Vitesse de base cohérente avec la vitesse initiale
-        acceleration_bonus = self.noise_time * 3.0  # Accélération progressive plus rapide
-        min_speed = base_min_speed + acceleration_bonus
-        
-        if current_speed < min_speed:
-            if current_speed > 0:
-                # Normaliser et appliquer la vitesse minimale croissante
-                self.vx = (self.vx / current_speed) * min_speed
-                self.vy = (self.vy / current_speed) * min_speed
-            else:
-                # Si complètement arrêté, utiliser la direction initiale vers le centre
-                dx_to_center = self.center_x - self.x
-                dy_to_center = self.center_y - self.y
-                distance_to_center = math.sqrt(dx_to_center * dx_to_center + dy_to_center * dy_to_center)
-                
-                if distance_to_center > 0:
-                    self.vx = (dx_to_center / distance_to_center) * min_speed
-                    self.vy = (dy_to_center / distance_to_center) * min_speed
-                else:
-                    # Dernière option : direction aléatoire
-                    angle = random.uniform(0, 2 * math.pi)
-                    self.vx = math.cos(angle) * min_speed
-                    self.vy = math.sin(angle) * min_speed
-        else:
-            # Même si la vitesse est suffisante, ajouter une micro-accélération constante
-            speed_boost = 1.001  # Augmentation de 0.1% à chaque frame
-            self.vx *= speed_boost
-            self.vy *= speed_boost
-        
-        # Répulsion entre joueurs avec accélération plus forte
-        for other in other_players:
-            if other.id != self.id:
-                dx = self.x - other.x
-                dy = self.y - other.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                min_distance = (self.radius + other.radius) * 2.5
-                if distance < min_distance and distance > 0:
-                    # Force de répulsion beaucoup plus forte lors des collisions entre joueurs
-                    force_magnitude = (Config.FORCE_REPULSION_JOUEURS * 3) / (distance * distance)  # 3x plus forte
-                    force_x = (dx / distance) * force_magnitude
-                    force_y = (dy / distance) * force_magnitude
-                    
-                    # Accélération plus importante lors des collisions entre joueurs
-                    acceleration_factor = 2.5  # Accélération supplémentaire
-                    self.vx += force_x * time_factor * acceleration_factor
-                    self.vy += force_y * time_factor * acceleration_factor
+        self.prev[:] = self.pos
         
-
-        
-        # Limiter la vitesse maximum
-        speed = math.sqrt(self.vx * self.vx + self.vy * self.vy)
-        if speed > Config.VITESSE_MAX_JOUEUR:
-            factor = Config.VITESSE_MAX_JOUEUR / speed
-            self.vx *= factor
-            self.vy *= factor
-        
-        # Mettre à jour la position
-        new_x = self.x + self.vx * time_factor
-        new_y = self.y + self.vy * time_factor
-        
-        # Collision avec les parois du cercle (rebond plus fréquent)
-        dx = new_x - self.center_x
-        dy = new_y - self.center_y
-        distance_from_center = math.sqrt(dx * dx + dy * dy)
-        
-        # Réduire la marge pour des rebonds plus fréquents
-        max_distance = self.circle_radius - self.radius * 0.5  # Rebond plus tôt
-        if distance_from_center > max_distance:
-            # Rebond vers le centre avec variation d'angle
-            
-            # Jouer le son de collision avec les bords
-            if self.sound_manager:
-                self.sound_manager.play_border_collision()
-            # Calculer la direction vers le centre du cercle
-            center_direction_x = self.center_x - new_x
-            center_direction_y = self.center_y - new_y
-            center_distance = math.sqrt(center_direction_x * center_direction_x + center_direction_y * center_direction_y)
-            
-            # Normaliser la direction vers le centre
-            if center_distance > 0:
-                center_direction_x /= center_distance
-                center_direction_y /= center_distance
-            
-            # Calculer l'angle vers le centre
-            center_angle = math.atan2(center_direction_y, center_direction_x)
-            
-            # Ajouter une variation de ±20° autour de la direction vers le centre
-            angle_variation = random.uniform(-20, 20)  # ±20° de variation
-            target_angle = center_angle + math.radians(angle_variation)
-
-            # Calculer la vitesse actuelle pour maintenir l'énergie
-            current_speed = math.sqrt(self.vx * self.vx + self.vy * self.vy)
-            
-            # Appliquer le nouveau vecteur de vitesse vers le centre avec variation ET accélération
-            bounce_coefficient = Config.COEFFICIENT_REBOND * random.uniform(1.0, 1.4)  # Jamais de ralentissement
-            speed_boost = 1.3  # Accélération de 30% lors du rebond sur les bords
-            boosted_speed = current_speed * bounce_coefficient * speed_boost
-            self.vx = math.cos(target_angle) * boosted_speed
-            self.vy = math.sin(target_angle) * boosted_speed
-            
-            # Repositionner le joueur à la limite
-            factor = max_distance / distance_from_center
-            new_x = self.center_x + dx * factor
-            new_y = self.center_y + dy * factor
-        
-        # Sauvegarder la position précédente avant la mise à jour
-        self.prev_x = self.x
-        self.prev_y = self.y
-        
-        self.x = new_x
-        self.y = new_y
-    
-    def update_power_reduction(self):
-        """Met à jour l'état de réduction de puissance."""
-        if self.power_reduction_frames > 0:
-            self.power_reduction_frames -= 1
-            self.power_factor = 1.0 - Config.REDUCTION_PUISSANCE_VALEUR
-            self.was_power_reduced = True
-        else:
-            self.power_factor = 1.0
-            self.was_power_reduced = False
+        # Disques pré-rastérisés pour chaque état (normal / puissance réduite)
+        self.sprites = self._create_sprites()
+    
+    # Accès scalaires vers les tableaux SoA
+    @property
+    def x(self) -> float:
+        return float(self.pos[0])
+    
+    @x.setter
+    def x(self, value: float):
+        self.pos[0] = value
+    
+    @property
+    def y(self) -> float:
+        return float(self.pos[1])
+    
+    @y.setter
+    def y(self, value: float):
+        self.pos[1] = value
+    
+    @property
+    def vx(self) -> float:
+        return float(self.vel[0])
+    
+    @vx.setter
+    def vx(self, value: float):
+        self.vel[0] = value
+    
+    @property
+    def vy(self) -> float:
+        return float(self.vel[1])
+    
+    @vy.setter
+    def vy(self, value: float):
+        self.vel[1] = value
+    
+    @property
+    def prev_x(self) -> float:
+        return float(self.prev[0])
+    
+    @property
+    def prev_y(self) -> float:
+        return float(self.prev[1])
+    
+    @property
+    def noise_time(self) -> float:
+        return float(self._noise_time[0])
+    
+    @noise_time.setter
+    def noise_time(self, value: float):
+        self._noise_time[0] = value
+    
+    @property
+    def power_reduction_frames(self) -> int:
+        return int(self._power_frames[0])
+    
+    @power_reduction_frames.setter
+    def power_reduction_frames(self, value: int):
+        self._power_frames[0] = value
+    
+    @property
+    def was_power_reduced(self) -> bool:
+        return bool(self._power_reduced[0])
+    
+    @was_power_reduced.setter
+    def was_power_reduced(self, value: bool):
+        self._power_reduced[0] = value
     
     def apply_power_reduction(self):
         """Applique une réduction de puissance temporaire."""
         self.power_reduction_frames = Config.REDUCTION_PUISSANCE_DUREE
     
-    def get_effective_power(self) -> float:
-        """Retourne la puissance effective du joueur."""
-        return self.power_factor * Config.VITESSE_JEU
-    
     def add_score(self, points: int):
         """Ajoute des points au score du joueur."""
         self.score += points
     
-    def check_elimination(self, targets: Dict[int, 'Target']):
-        """Vérifie si le joueur doit être éliminé (plus de lignes)."""
-        owned_count = sum(1 for target in targets.values() if target.owner_id == self.id)
+    def check_elimination(self, owned_count: int):
+        """Vérifie si le joueur doit être éliminé (plus de lignes), d'après son nombre de lignes possédées."""
         if owned_count == 0 and not self.is_eliminated:
             self.is_eliminated = True
             print(f"Joueur {self.id + 1} éliminé - plus de lignes !")
@@ -790,47 +1030,54 @@ class Player:
                 self.sound_manager.play_elimination()
         return self.is_eliminated
     
-    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
-        """Dessine le joueur sur l'écran."""
+    def _create_sprites(self) -> Dict[bool, Tuple[pygame.Surface, int]]:
+        """Pré-rastérise le disque du joueur, indexé par l'état de puissance réduite."""
+        outline_color = (max(0, self.color[0] - 50), max(0, self.color[1] - 50), max(0, self.color[2] - 50))
+        sprites = {}
+        for reduced in (False, True):
+            # Taille dynamique selon l'état
+            radius = int(self.radius) if not reduced else int(self.radius * 0.8)
+            half = radius + 4  # Marge pour l'indicateur de puissance réduite (rayon + 3)
+            surface = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+            center = (half, half)
+            
+            # Cercle principal du joueur
+            pygame.draw.circle(surface, self.color, center, radius)
+            
+            # Contour plus foncé
+            pygame.draw.circle(surface, outline_color, center, radius, 2)
+            
+            # Indicateur de puissance réduite
+            if reduced:
+                pygame.draw.circle(surface, (255, 100, 100), center, radius + 3, 1)
+            
+            sprites[reduced] = (surface.convert_alpha(), half)
+        return sprites
+    
+    def get_sprite_blit(self) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Retourne le couple (surface, position) à blitter, ou None si le joueur est éliminé."""
         # Ne pas dessiner les joueurs éliminés
         if self.is_eliminated:
-            return
-            
-        # Taille dynamique selon l'état
-        radius = int(self.radius) if not self.was_power_reduced else int(self.radius * 0.8)
-        
-        # Cercle principal du joueur
-        pygame.draw.circle(
-            screen,
-            self.color,
-            (int(self.x), int(self.y)),
-            radius
-        )
-        
-        # Contour plus foncé
-        pygame.draw.circle(
-            screen,
-            (max(0, self.color[0] - 50), max(0, self.color[1] - 50), max(0, self.color[2] - 50)),
-            (int(self.x), int(self.y)),
-            radius,
-            2
-        )
-        
-        # Indicateur de puissance réduite
-        if self.was_power_reduced:
-            pygame.draw.circle(
-                screen,
-                (255, 100, 100),
-                (int(self.x), int(self.y)),
-                radius + 3,
-                1
-            )
+            return None
+        surface, half = self.sprites[self.was_power_reduced]
+        return surface, (int(self.pos[0]) - half, int(self.pos[1]) - half)
+    
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
+        """Dessine le joueur sur l'écran."""
+        blit = self.get_sprite_blit()
+        if blit is not None:
+            screen.blit(*blit)
 
 
 class Target:
     """Classe représentant une cible sur le périmètre du cercle."""
     
-    def __init__(self, target_id: int, angle: float, center_x: float, center_y: float, radius: float):
+    __slots__ = ('owners', '_blink_frames', '_blinking', 'id', 'angle', 'angle_deg',
+                 'center_x', 'center_y', 'radius', 'x', 'y', 'owner_id', 'previous_owner_id')
+    
+    def __init__(self, target_id: int, angle: float, center_x: float, center_y: float, radius: float,
+                 owners: Optional[np.ndarray] = None,
+                 blink_frames: Optional[np.ndarray] = None, blinking: Optional[np.ndarray] = None):
         """
         Initialise une cible.
         
@@ -839,9 +1086,15 @@ class Target:
             angle: Angle en radians sur le cercle
             center_x, center_y: Centre du cercle
             radius: Rayon du cercle
+            owners: Tableau SoA des propriétaires du jeu (indexé par target_id, -1 = libre)
+            blink_frames, blinking: Vues (1,) sur l'état de clignotement de la cible dans le jeu
         """
+        self.owners = owners
+        self._blink_frames = blink_frames if blink_frames is not None else np.zeros(1, dtype=np.int16)
+        self._blinking = blinking if blinking is not None else np.zeros(1, dtype=bool)
         self.id = target_id
         self.angle = angle
+        self.angle_deg = math.degrees(angle) % 360
         self.center_x = center_x
         self.center_y = center_y
         self.radius = radius
@@ -858,63 +1111,58 @@ class Target:
         self.counter_attack_frames = 0
         self.is_blinking = False
     
+    @property
+    def counter_attack_frames(self) -> int:
+        return int(self._blink_frames[0])
+    
+    @counter_attack_frames.setter
+    def counter_attack_frames(self, value: int):
+        self._blink_frames[0] = value
+    
+    @property
+    def is_blinking(self) -> bool:
+        return bool(self._blinking[0])
+    
+    @is_blinking.setter
+    def is_blinking(self, value: bool):
+        self._blinking[0] = value
+    
     def set_owner(self, player_id: int):
         """Définit le propriétaire de la cible."""
         self.previous_owner_id = self.owner_id
         self.owner_id = player_id
+        if self.owners is not None:
+            self.owners[self.id] = player_id
         
         # Si la cible change de propriétaire, activer l'effet visuel
         if self.previous_owner_id is not None and self.previous_owner_id != player_id:
             self.counter_attack_frames = Config.DUREE_CLIGNOTEMENT
     
-    def update_visual_effects(self):
-        """Met à jour les effets visuels."""
-        if self.counter_attack_frames > 0:
-            self.counter_attack_frames -= 1
-            self.is_blinking = True
-        else:
-            self.is_blinking = False
-    
     def get_angle_degrees(self) -> float:
-        """Retourne l'angle en degrés."""
-        return math.degrees(self.angle) % 360
-    
-    def draw(self, screen: pygame.Surface, players: Dict[int, Player]):
-        """Dessine la cible sur l'écran."""
-        # Taille adaptée au nombre de cibles (plus petites si plus nombreuses)
-        # On utilise un dict global pour compter les cibles, approximation avec players pour l'instant
-        base_radius = 3 if len(players) > 3 else 4  # Simple heuristique
-        
-        # Couleur de base
-        if self.owner_id is None:
-            color = Config.COULEUR_CIBLE_LIBRE
-            radius = base_radius
-        else:
-            color = players[self.owner_id].color
-            radius = base_radius + 1
-        
-        # Effet de clignotement pour les contre-attaques
-        if self.is_blinking and (pygame.time.get_ticks() // 100) % 2 == 0:
-            color = Config.COULEUR_CONTRE_ATTAQUE
-            radius += 1
-        
-        # Dessiner la cible
-        pygame.draw.circle(
-            screen,
-            color,
-            (int(self.x), int(self.y)),
-            radius
-        )
-        
-        # Contour seulement pour les cibles possédées ou en cours de clignotement
-        if self.owner_id is not None or self.is_blinking:
-            pygame.draw.circle(
-                screen,
-                Config.COULEUR_TEXTE,
-                (int(self.x), int(self.y)),
-                radius,
-                1
-            )
+        """Retourne l'angle en degrés (calculé une fois à l'initialisation)."""
+        return self.angle_deg
+
+
+class TextCache:
+    """Cache LRU des rendus de texte antialiasés, indexé par (police, texte, couleur)."""
+    
+    def __init__(self, max_size: int = 256):
+        """Initialise un cache vide de max_size surfaces au plus."""
+        self.max_size = max_size
+        self.surfaces: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+    
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Retourne le rendu du texte, converti au format de l'écran, en ne rastérisant qu'au premier appel."""
+        key = (id(font), text, color)
+        surface = self.surfaces.pop(key, None)
+        if surface is None:
+            # Timer et saisie des noms produisent des textes nouveaux : évincer le moins récemment utilisé
+            if len(self.surfaces) >= self.max_size:
+                del self.surfaces[next(iter(self.surfaces))]
+            surface = font.render(text, True, color).convert_alpha()
+        # Réinsertion en fin de dict : l'ordre d'insertion sert d'ordre LRU
+        self.surfaces[key] = surface
+        return surface
 
 
 class ConfigScreen:
@@ -928,6 +1176,16 @@ class ConfigScreen:
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
+        # Rendus de texte mis en cache : la plupart des libellés ne changent jamais entre deux frames
+        self.text_cache = TextCache()
+        # Pastilles et carrés de couleur des joueurs, rastérisés une fois par (couleur, numéro)
+        self.player_badges: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
+        self.color_swatches: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        self.name_boxes: Dict[bool, pygame.Surface] = {}
+        
+        # Dernier état présenté à l'écran (None : présentation complète au prochain draw)
+        self.last_view_state = None
+        self.cursor_phase = 0  # Phase de clignotement du curseur lors du dernier draw
         
         # État de l'interface
         self.running = True
@@ -980,6 +1238,10 @@ class ConfigScreen:
                 self.running = False
                 return
             
+            # Fenêtre réexposée : le contenu affiché doit être entièrement représenté
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.last_view_state = None
+            
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
@@ -1000,20 +1262,9 @@ class ConfigScreen:
                     else:
                         # Gestion des caractères tapés
                         if len(self.input_text) < 20:  # Limite de caractères
-                            # Utiliser event.unicode si disponible, sinon convertir depuis event.key
-                            if hasattr(event, 'unicode') and event.unicode and event.unicode.isprintable():
+                            # KEYDOWN fournit toujours event.unicode (majuscules et disposition clavier incluses)
+                            if event.unicode and event.unicode.isprintable():
                                 self.input_text += event.unicode
-                            elif event.key >= 32 and event.key <= 126:  # Caractères ASCII imprimables
-                                # Conversion basique pour les lettres et chiffres
-                                if event.key >= pygame.K_a and event.key <= pygame.K_z:
-                                    char = chr(event.key)
-                                    if pygame.key.get_pressed()[pygame.K_LSHIFT] or pygame.key.get_pressed()[pygame.K_RSHIFT]:
-                                        char = char.upper()
-                                    self.input_text += char
-                                elif event.key >= pygame.K_0 and event.key <= pygame.K_9:
-                                    self.input_text += chr(event.key)
-                                elif event.key == pygame.K_SPACE:
-                                    self.input_text += " "
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Clic gauche
@@ -1022,52 +1273,105 @@ class ConfigScreen:
     
     def handle_click(self, pos):
         """Gère les clics de souris."""
+        # Un seul test côté C sur tous les boutons (ils ne se superposent pas)
+        hit = pygame.Rect(pos, (1, 1)).collidedict(self.buttons, True)
+        if hit is None:
+            return
+        button = hit[0]
+        
         # Bouton Start
-        if self.buttons['start'].collidepoint(pos):
+        if button == 'start':
             self.game_ready = True
             return
         
         # Contrôles nombre de joueurs
-        if self.buttons['players_minus'].collidepoint(pos):
+        if button == 'players_minus':
             self.num_players = max(2, self.num_players - 1)
             self.user_interacted = True
-        elif self.buttons['players_plus'].collidepoint(pos):
+        elif button == 'players_plus':
             self.num_players = min(6, self.num_players + 1)
             self.user_interacted = True
         
         # Contrôles durée
-        elif self.buttons['time_minus'].collidepoint(pos):
+        elif button == 'time_minus':
             self.game_duration = max(30, self.game_duration - 30)
             self.user_interacted = True
-        elif self.buttons['time_plus'].collidepoint(pos):
+        elif button == 'time_plus':
             self.game_duration = min(300, self.game_duration + 30)
             self.user_interacted = True
         
         # Noms et couleurs des joueurs
-        for i in range(5):
-            if self.buttons[f'name_{i}'].collidepoint(pos) and i < self.num_players:
+        else:
+            kind, index = button.split('_')
+            i = int(index)
+            if i >= self.num_players:
+                return
+            if kind == 'name':
                 self.input_active = f'name_{i}'
                 self.input_text = self.player_names[i]
                 self.user_interacted = True
-            elif self.buttons[f'color_{i}'].collidepoint(pos) and i < self.num_players:
+            else:
                 # Changer la couleur du joueur
                 current_color_idx = self.available_colors.index(self.player_colors[i]) if self.player_colors[i] in self.available_colors else 0
                 next_color_idx = (current_color_idx + 1) % len(self.available_colors)
                 self.player_colors[i] = self.available_colors[next_color_idx]
                 self.user_interacted = True
     
+    def get_player_badge(self, color: Tuple[int, int, int], number: int) -> pygame.Surface:
+        """Retourne la pastille du joueur (cercle coloré, contour blanc et numéro), rastérisée une seule fois."""
+        key = (color, number)
+        badge = self.player_badges.get(key)
+        if badge is None:
+            badge = pygame.Surface((24, 24), pygame.SRCALPHA)
+            pygame.draw.circle(badge, color, (12, 12), 12)
+            pygame.draw.circle(badge, (255, 255, 255), (12, 12), 12, 2)
+            num_text = self.text_cache.render(self.font_small, str(number), (255, 255, 255))
+            badge.blit(num_text, num_text.get_rect(center=(12, 12)))
+            badge = badge.convert_alpha()
+            self.player_badges[key] = badge
+        return badge
+    
+    def get_color_swatch(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Retourne le carré de sélection de couleur (avec contour blanc), rastérisé une seule fois."""
+        swatch = self.color_swatches.get(color)
+        if swatch is None:
+            swatch = pygame.Surface((30, 30))
+            swatch.fill(color)
+            pygame.draw.rect(swatch, (255, 255, 255), swatch.get_rect(), 2)
+            swatch = swatch.convert()
+            self.color_swatches[color] = swatch
+        return swatch
+    
+    def get_name_box(self, is_active: bool) -> pygame.Surface:
+        """Retourne le fond encadré d'un champ de nom (normal ou en cours d'édition), rastérisé une seule fois."""
+        box = self.name_boxes.get(is_active)
+        if box is None:
+            name_color = (255, 255, 100) if is_active else (255, 255, 255)
+            bg_color = (60, 65, 80) if is_active else (50, 55, 70)
+            box = pygame.Surface((200, 30))
+            box.fill(bg_color)
+            pygame.draw.rect(box, name_color, box.get_rect(), 2)
+            box = box.convert()
+            self.name_boxes[is_active] = box
+        return box
+    
+    def get_view_state(self) -> Tuple:
+        """Retourne tout ce qui détermine l'affichage de l'écran de configuration, hors clignotement du curseur."""
+        return (self.num_players, self.game_duration, tuple(self.player_names), tuple(self.player_colors),
+                self.input_active, self.input_text)
+    
     def draw(self):
         """Dessine l'interface de configuration."""
         # Fond simple et uniforme
         self.screen.fill((25, 30, 45))
         
         # Titre simple
-        title = self.font_large.render("Configuration", True, (255, 255, 255))
+        title = self.text_cache.render(self.font_large, "Configuration", (255, 255, 255))
         title_rect = title.get_rect(center=(Config.LARGEUR // 2, 60))
         self.screen.blit(title, title_rect)
         
         # Nombre de joueurs
-        players_label = self.font_medium.render("Nombre de joueurs:", True, (255, 255, 255))
+        players_label = self.text_cache.render(self.font_medium, "Nombre de joueurs:", (255, 255, 255))
         self.screen.blit(players_label, (50, 120))
         
         # Boutons +/-
@@ -1076,22 +1380,22 @@ class ConfigScreen:
         
         pygame.draw.rect(self.screen, (70, 70, 90), minus_btn)
         pygame.draw.rect(self.screen, (120, 120, 140), minus_btn, 2)
-        minus_text = self.font_medium.render("-", True, (255, 255, 255))
+        minus_text = self.text_cache.render(self.font_medium, "-", (255, 255, 255))
         minus_rect = minus_text.get_rect(center=minus_btn.center)
         self.screen.blit(minus_text, minus_rect)
         
         pygame.draw.rect(self.screen, (70, 70, 90), plus_btn)
         pygame.draw.rect(self.screen, (120, 120, 140), plus_btn, 2)
-        plus_text = self.font_medium.render("+", True, (255, 255, 255))
+        plus_text = self.text_cache.render(self.font_medium, "+", (255, 255, 255))
         plus_rect = plus_text.get_rect(center=plus_btn.center)
         self.screen.blit(plus_text, plus_rect)
         
         # Affichage du nombre séparé des boutons
-        num_text = self.font_medium.render(str(self.num_players), True, (255, 255, 255))
+        num_text = self.text_cache.render(self.font_medium, str(self.num_players), (255, 255, 255))
         self.screen.blit(num_text, (310, 125))
         
         # Durée de partie
-        time_label = self.font_medium.render("Durée (secondes):", True, (255, 255, 255))
+        time_label = self.text_cache.render(self.font_medium, "Durée (secondes):", (255, 255, 255))
         self.screen.blit(time_label, (50, 170))
         
         # Boutons +/- pour le temps
@@ -1100,68 +1404,66 @@ class ConfigScreen:
         
         pygame.draw.rect(self.screen, (70, 70, 90), time_minus_btn)
         pygame.draw.rect(self.screen, (120, 120, 140), time_minus_btn, 2)
-        minus_text = self.font_medium.render("-", True, (255, 255, 255))
+        minus_text = self.text_cache.render(self.font_medium, "-", (255, 255, 255))
         minus_rect = minus_text.get_rect(center=time_minus_btn.center)
         self.screen.blit(minus_text, minus_rect)
         
         pygame.draw.rect(self.screen, (70, 70, 90), time_plus_btn)
         pygame.draw.rect(self.screen, (120, 120, 140), time_plus_btn, 2)
-        plus_text = self.font_medium.render("+", True, (255, 255, 255))
+        plus_text = self.text_cache.render(self.font_medium, "+", (255, 255, 255))
         plus_rect = plus_text.get_rect(center=time_plus_btn.center)
         self.screen.blit(plus_text, plus_rect)
         
         # Affichage du temps séparé des boutons
-        time_text = self.font_medium.render(f"{self.game_duration}s", True, (255, 255, 255))
+        time_text = self.text_cache.render(self.font_medium, f"{self.game_duration}s", (255, 255, 255))
         self.screen.blit(time_text, (310, 175))
         
+        # Phase du curseur clignotant (500 ms), lue une fois par frame
+        self.cursor_phase = (pygame.time.get_ticks() // 500) % 2
+        
         # Configuration des joueurs
-        players_title = self.font_medium.render("Configuration des joueurs:", True, (255, 255, 255))
+        players_title = self.text_cache.render(self.font_medium, "Configuration des joueurs:", (255, 255, 255))
         self.screen.blit(players_title, (50, 240))
         
+        # Lignes des joueurs : uniquement des surfaces en cache, envoyées en un seul appel groupé
+        row_blits = []
         for i in range(self.num_players):
             y_pos = 280 + i * 50
             
-            # Cercle de couleur simple
-            pygame.draw.circle(self.screen, self.player_colors[i], (70, y_pos + 15), 12)
-            pygame.draw.circle(self.screen, (255, 255, 255), (70, y_pos + 15), 12, 2)
-            
-            # Numéro du joueur
-            num_text = self.font_small.render(str(i + 1), True, (255, 255, 255))
-            num_rect = num_text.get_rect(center=(70, y_pos + 15))
-            self.screen.blit(num_text, num_rect)
+            # Cercle de couleur avec le numéro du joueur (pré-rastérisé)
+            row_blits.append((self.get_player_badge(self.player_colors[i], i + 1), (58, y_pos + 3)))
             
             # Nom du joueur
             is_active = self.input_active == f'name_{i}'
             name_color = (255, 255, 100) if is_active else (255, 255, 255)
-            bg_color = (60, 65, 80) if is_active else (50, 55, 70)
             
             name_rect = pygame.Rect(100, y_pos, 200, 30)
-            pygame.draw.rect(self.screen, bg_color, name_rect)
-            pygame.draw.rect(self.screen, name_color, name_rect, 2)
+            row_blits.append((self.get_name_box(is_active), name_rect))
             
             # Afficher le texte
             display_name = self.input_text if is_active else self.player_names[i]
-            if is_active and (pygame.time.get_ticks() // 500) % 2 == 0:
+            if is_active and self.cursor_phase == 0:
                 display_name += "|"
             
-            name_surface = self.font_small.render(display_name[:25], True, name_color)
-            self.screen.blit(name_surface, (name_rect.x + 5, name_rect.y + 6))
+            name_surface = self.text_cache.render(self.font_small, display_name[:25], name_color)
+            row_blits.append((name_surface, (name_rect.x + 5, name_rect.y + 6)))
             
             # Bouton couleur simple
             color_rect = pygame.Rect(320, y_pos, 30, 30)
-            pygame.draw.rect(self.screen, self.player_colors[i], color_rect)
-            pygame.draw.rect(self.screen, (255, 255, 255), color_rect, 2)
+            row_blits.append((self.get_color_swatch(self.player_colors[i]), color_rect))
             
             # Mise à jour des boutons
             self.buttons[f'name_{i}'] = name_rect
             self.buttons[f'color_{i}'] = color_rect
         
+        self.screen.blits(row_blits, doreturn=False)
+        
         # Bouton Start simple
         start_btn = self.buttons['start']
         pygame.draw.rect(self.screen, (60, 150, 60), start_btn)
         pygame.draw.rect(self.screen, (255, 255, 255), start_btn, 2)
         
-        start_text = self.font_medium.render("COMMENCER", True, (255, 255, 255))
+        start_text = self.text_cache.render(self.font_medium, "COMMENCER", (255, 255, 255))
         start_rect = start_text.get_rect(center=start_btn.center)
         self.screen.blit(start_text, start_rect)
         
@@ -1173,11 +1475,18 @@ class ConfigScreen:
         
         y = Config.HAUTEUR - 160
         for instruction in instructions:
-            text = self.font_small.render(instruction, True, (200, 200, 200))
+            text = self.text_cache.render(self.font_small, instruction, (200, 200, 200))
             self.screen.blit(text, (50, y))
             y += 25
         
-        pygame.display.flip()
+        # L'écran est presque statique : ne présenter que ce qui a changé depuis la dernière frame
+        view_state = self.get_view_state()
+        if view_state != self.last_view_state:
+            pygame.display.flip()
+            self.last_view_state = view_state
+        elif self.input_active is not None:
+            # Seul le curseur du champ en cours d'édition clignote
+            pygame.display.update(self.buttons[self.input_active])
     
     def run(self):
         """Boucle principale de l'interface de configuration."""
@@ -1185,7 +1494,11 @@ class ConfigScreen:
         
         while self.running and not self.game_ready:
             self.handle_events()
-            self.draw()
+            # Redessiner seulement après un changement d'état ou un battement du curseur
+            cursor_blinked = (self.input_active is not None and
+                              (pygame.time.get_ticks() // 500) % 2 != self.cursor_phase)
+            if self.last_view_state is None or cursor_blinked or self.get_view_state() != self.last_view_state:
+                self.draw()
             clock.tick(60)
         if self.game_ready:
             return self.get_config()
@@ -1280,14 +1593,16 @@ class BattleGame:
         # Variables de jeu
         self.running = True
         self.frame_count = 0
-        self.last_fps_update = time.time()
+        self.last_fps_update = time.monotonic_ns()  # Horloge monotone, en nanosecondes entières
         self.current_fps = 0
+        self.dt = 1.0 / Config.FPS  # Pas de temps fixe d'une frame
         
         # Timer de partie
-        self.game_start_time = time.time()
+        self.game_start_time = time.monotonic()
         self.remaining_time = self.game_duration
         self.game_ended = False
         self.winner_by_time = None
+        self.victory_announced = False
         self.end_game_alert_played = False  # Pour éviter de jouer l'alerte plusieurs fois
         
         # Système d'accélération progressive
@@ -1300,15 +1615,53 @@ class BattleGame:
         self.center_y = Config.get_center_y()
         
         # Initialisation des joueurs et cibles
-        self.players: Dict[int, Player] = {}
-        self.targets: Dict[int, Target] = {}
+        # Listes indexées directement par identifiant (0..N-1), alignées sur les lignes des tableaux SoA
+        self.players: List[Player] = []
+        self.targets: List[Target] = []
         self.game_time = 0.0
         
+        # État physique des joueurs en Structure-of-Arrays (une ligne par joueur), en float32 :
+        # largement suffisant pour des pixels. Seul le temps de bruit reste en float64, car il
+        # s'ajoute à des décalages jusqu'à 5000 où float32 quantifierait l'avancée par frame.
+        self.pos = np.zeros((self.num_players, 2), dtype=np.float32)
+        self.vel = np.zeros((self.num_players, 2), dtype=np.float32)
+        self.prev = np.zeros((self.num_players, 2), dtype=np.float32)
+        self.radii = np.full(self.num_players, Config.RAYON_JOUEUR, dtype=np.float32)
+        self.noise_time = np.zeros(self.num_players, dtype=np.float64)
+        self.active = np.ones(self.num_players, dtype=bool)
+        # Réduction de puissance : frames restantes et état de la frame courante
+        self.power_frames = np.zeros(self.num_players, dtype=np.int16)
+        self.power_reduced = np.zeros(self.num_players, dtype=bool)
+        # Constantes de mouvement transmises au noyau de physique
+        self.physics_params = np.array([
+            Config.VITESSE_MOUVEMENT_JOUEUR,
+            Config.AMPLITUDE_BRUIT_POSITION,
+            Config.FORCE_REPULSION_JOUEURS,
+            Config.VITESSE_MAX_JOUEUR,
+            Config.COEFFICIENT_REBOND,
+        ], dtype=np.float32)
+        # Cibles en Structure-of-Arrays (les objets Target restent des façades)
+        self.target_pos = np.empty((0, 2), dtype=np.float32)
+        self.target_angle_deg = np.empty(0, dtype=np.float32)
+        self.target_owner = np.empty(0, dtype=np.int16)
+        self.bucket_size = 2 * math.pi
+        self.target_buckets = np.full((1, 1), -1, dtype=np.int64)
+        self.target_hits = np.empty((0, 2), dtype=np.int64)
+        self.crossed_targets = np.empty(0, dtype=np.int64)
+        self.target_pixels: List[Tuple[int, int]] = []
+        self.target_blink_frames = np.empty(0, dtype=np.int16)
+        self.target_blinking = np.empty(0, dtype=bool)
+        
         # Optimisations de performance
         self.background_surface = None
         self.ui_surface = None
+        self.ui_static_surface = None
         self.ui_needs_update = True
         self.target_update_counter = 0  # Pour réduire la fréquence de mise à jour
+        self.score_dot_sprites: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
+        self.score_panel_key: Optional[Tuple[Tuple[int, bool], ...]] = None
+        self.score_panel_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self.text_cache = TextCache()
         self.last_ui_update = 0
         
         # Système de confettis
@@ -1316,16 +1669,44 @@ class BattleGame:
         
         self.init_players()
         self.init_targets()
+        
+        # Paramètres de bruit des joueurs regroupés pour le noyau de physique
+        self.noise_seeds = np.array([p.noise_generator.seed for p in self.players], dtype=np.int64)
+        self.noise_offsets = np.array([(p.noise_offset_x, p.noise_offset_y) for p in self.players], dtype=np.float64)
         self.create_background_surface()
         
         # Attribution initiale des cibles
         self.update_target_ownership()
         
+        # Compiler les noyaux maintenant plutôt qu'à la première frame, puis démarrer le timer
+        # pour que la compilation ne soit pas décomptée du temps de jeu
+        self.warm_up_kernels()
+        self.game_start_time = time.monotonic()
+        
         print("Jeu initialisé avec succès !")
     
+    def warm_up_kernels(self):
+        """Déclenche la compilation JIT des noyaux (bruit, physique, franchissement) sur des copies de l'état."""
+        if not NUMBA_DISPONIBLE:
+            return
+        self.players[0].noise_generator.noise(0.5, 0.5)
+        # Mêmes types que les vrais appels (la spécialisation compilée est réutilisée), sans toucher à l'état
+        pos = self.pos.copy()
+        prev = self.prev.copy()
+        _physics_step(
+            pos, self.vel.copy(), prev, self.noise_time.copy(),
+            self.noise_offsets, self.noise_seeds, self.radii, self.active,
+            float(self.center_x), float(self.center_y), float(Config.TAILLE_CERCLE),
+            self.target_pos, self.target_buckets, self.bucket_size,
+            self.dt, self.physics_params, self.target_hits.copy()
+        )
+        _crossed_lines(0, float(self.radii[0]), pos, prev,
+                       self.target_pos, self.target_owner.copy(), self.active, self.crossed_targets.copy())
+    
     def create_background_surface(self):
         """Crée une surface d'arrière-plan précalculée pour optimiser les performances."""
-        self.background_surface = pygame.Surface((Config.LARGEUR, Config.HAUTEUR))
+        # Format natif de l'écran : le blit de chaque frame devient une simple copie
+        self.background_surface = pygame.Surface((Config.LARGEUR, Config.HAUTEUR)).convert()
         self.background_surface.fill(Config.COULEUR_FOND)
         
         # Dessiner le cercle principal sur l'arrière-plan
@@ -1341,12 +1722,17 @@ class BattleGame:
         """Initialise les joueurs."""
         for i in range(self.num_players):
             color = self.player_colors[i] if i < len(self.player_colors) else Config.COULEURS_JOUEURS[i % len(Config.COULEURS_JOUEURS)]
-            player = Player(i, color, self.center_x, self.center_y, Config.TAILLE_CERCLE, self.num_players, self.sound_manager)
+            player = Player(i, color, self.center_x, self.center_y, Config.TAILLE_CERCLE, self.num_players, self.sound_manager,
+                            pos=self.pos[i], vel=self.vel[i], prev=self.prev[i],
+                            noise_time=self.noise_time[i:i + 1],
+                            power_frames=self.power_frames[i:i + 1],
+                            power_reduced=self.power_reduced[i:i + 1])
             if i < len(self.player_names):
                 player.name = self.player_names[i]
             else:
                 player.name = f"Joueur {i+1}"
-            self.players[i] = player
+            self.radii[i] = player.radius
+            self.players.append(player)
     
     def init_targets(self):
         """Initialise les cibles sur le périmètre du cercle."""
@@ -1357,25 +1743,47 @@ class BattleGame:
         
         print(f"Création de {num_targets} cibles sur le cercle (circonférence: {circumference:.0f}px)")
         
-        for i in range(num_targets):
-            angle = (2 * math.pi * i) / num_targets
-            target = Target(i, angle, self.center_x, self.center_y, Config.TAILLE_CERCLE)
-            self.targets[i] = target
-    
-    def get_closest_player_to_target(self, target: Target) -> Optional[int]:
-        """Trouve le joueur le plus proche d'une cible donnée (optimisé)."""
-        min_distance_sq = float('inf')  # Utiliser le carré de la distance pour éviter sqrt
-        closest_player_id = None
-        
-        for player_id, player in self.players.items():
-            # Calcul du carré de la distance (plus rapide)
-            distance_sq = (player.x - target.x) ** 2 + (player.y - target.y) ** 2
-            
-            if distance_sq < min_distance_sq:
-                min_distance_sq = distance_sq
-                closest_player_id = player_id
-        
-        return closest_player_id
+        angles = np.linspace(0, 2 * math.pi, num_targets, endpoint=False)
+        self.target_pos = np.empty((num_targets, 2), dtype=np.float32)
+        self.target_pos[:, 0] = self.center_x + Config.TAILLE_CERCLE * np.cos(angles)
+        self.target_pos[:, 1] = self.center_y + Config.TAILLE_CERCLE * np.sin(angles)
+        self.target_angle_deg = np.degrees(angles).astype(np.float32)
+        self.target_owner = np.full(num_targets, -1, dtype=np.int16)
+        # Coordonnées entières des cibles pour le dessin des connexions
+        self.target_pixels = []
+        # Clignotement de contre-attaque : frames restantes et état de la frame courante
+        self.target_blink_frames = np.zeros(num_targets, dtype=np.int16)
+        self.target_blinking = np.zeros(num_targets, dtype=bool)
+        # Tampon de sortie réutilisé par la détection de franchissement de lignes
+        self.crossed_targets = np.empty(num_targets, dtype=np.int64)
+        
+        for i, angle in enumerate(angles.tolist()):
+            target = Target(i, angle, self.center_x, self.center_y, Config.TAILLE_CERCLE,
+                            self.target_owner,
+                            self.target_blink_frames[i:i + 1], self.target_blinking[i:i + 1])
+            self.targets.append(target)
+            self.target_pixels.append((int(target.x), int(target.y)))
+        
+        # Secteurs angulaires pour la détection de collision : un secteur doit couvrir au
+        # moins l'angle sous lequel un joueur peut toucher une cible (asin(r / R))
+        reach = math.asin(min(1.0, float(self.radii.max()) / Config.TAILLE_CERCLE))
+        num_buckets = max(1, min(num_targets // 2, int(2 * math.pi / reach)))
+        self.bucket_size = 2 * math.pi / num_buckets
+        buckets: List[List[int]] = [[] for _ in range(num_buckets)]
+        for i, angle in enumerate(angles.tolist()):
+            buckets[int(angle / self.bucket_size) % num_buckets].append(i)
+        # Cibles candidates par secteur : le secteur et ses deux voisins, triées par indice
+        # (une ligne par secteur, complétée par -1)
+        candidates = [
+            sorted(buckets[b - 1] + buckets[b] + buckets[(b + 1) % num_buckets])
+            if num_buckets >= 3 else list(range(num_targets))
+            for b in range(num_buckets)
+        ]
+        self.target_buckets = np.full((num_buckets, max(len(c) for c in candidates)), -1, dtype=np.int64)
+        for b, targets in enumerate(candidates):
+            self.target_buckets[b, :len(targets)] = targets
+        # Tampon de sortie du noyau de physique : au plus une ligne de secteur par joueur
+        self.target_hits = np.empty((self.num_players * self.target_buckets.shape[1], 2), dtype=np.int64)
     
     def check_interference_zone(self, target: Target, new_owner_id: int) -> bool:
         """
@@ -1385,10 +1793,10 @@ class BattleGame:
         target_angle = target.get_angle_degrees()
         
         # Chercher les joueurs avec une réduction de puissance active
-        for player_id, player in self.players.items():
+        for player_id, player in enumerate(self.players):
             if player.was_power_reduced and player_id != new_owner_id:
                 # Chercher les cibles récemment perdues par ce joueur
-                for other_target in self.targets.values():
+                for other_target in self.targets:
                     if (other_target.previous_owner_id == player_id and 
                         other_target.owner_id != player_id and
                         other_target.id != target.id):
@@ -1408,248 +1816,140 @@ class BattleGame:
         
         return False
     
-    def handle_player_collisions(self):
-        """Gère les collisions directes entre joueurs."""
-        players_list = list(self.players.values())
+    def step_physics(self, dt: float) -> np.ndarray:
+        """
+        Avance la physique de tous les joueurs d'un pas via le noyau fusionné.
         
-        for i in range(len(players_list)):
-            for j in range(i + 1, len(players_list)):
-                player1 = players_list[i]
-                player2 = players_list[j]
-                
-                # Ignorer les collisions avec les joueurs éliminés
-                if player1.is_eliminated or player2.is_eliminated:
-                    continue
+        Joue les sons de rebond et de collision, et retourne les paires
+        (joueur, cible) touchées à traiter par apply_target_hits.
+        """
+        border_hits, collisions, num_hits = _physics_step(
+            self.pos, self.vel, self.prev, self.noise_time,
+            self.noise_offsets, self.noise_seeds, self.radii, self.active,
+            float(self.center_x), float(self.center_y), float(Config.TAILLE_CERCLE),
+            self.target_pos, self.target_buckets, self.bucket_size,
+            dt, self.physics_params, self.target_hits
+        )
+        
+        # Jouer le son de collision avec les bords
+        for _ in range(border_hits):
+            self.sound_manager.play_border_collision()
+        
+        # Jouer le son de collision entre joueurs
+        for _ in range(collisions):
+            self.sound_manager.play_player_collision()
+        
+        return self.target_hits[:num_hits]
+    
+    def apply_target_hits(self, hits: np.ndarray):
+        """Attribue les cibles touchées (paires joueur/cible) à leur nouveau propriétaire."""
+        # Parcours dans l'ordre joueur puis cible, comme la boucle séquentielle
+        for player_id, target_id in hits.tolist():
+            player = self.players[player_id]
+            target = self.targets[target_id]
+            # Le joueur touche cette cible
+            if target.owner_id != player.id:  # Si ce n'est pas déjà sa cible
+                old_owner = target.owner_id
+                target.set_owner(player.id)
                 
-                # Calculer la distance entre les joueurs
-                dx = player2.x - player1.x
-                dy = player2.y - player1.y
-                distance = math.sqrt(dx * dx + dy * dy)
+                # Jouer le son de vol de ligne
+                self.sound_manager.play_line_steal()
                 
-                min_distance = player1.radius + player2.radius
+                # Ajouter des points au joueur qui a touché la cible
+                player.add_score(1)
                 
-                if distance < min_distance and distance > 0:
-                    # Collision détectée - rebond avec directions divergentes
-                    
-                    # Jouer le son de collision entre joueurs
-                    self.sound_manager.play_player_collision()
-                    
-                    # Calculer l'angle de collision
-                    collision_angle = math.atan2(dy, dx)
-                    
-                    # Vitesses actuelles des joueurs
-                    speed1 = math.sqrt(player1.vx * player1.vx + player1.vy * player1.vy)
-                    speed2 = math.sqrt(player2.vx * player2.vx + player2.vy * player2.vy)
-                    
-                    # Vitesse moyenne pour maintenir l'énergie
-                    avg_speed = (speed1 + speed2) / 2
-                    
-                    # Force de rebond énergique
-                    bounce_speed = avg_speed * 1.4  # 40% d'augmentation
-                    
-                    # Calculer les angles de rebond avec divergence minimale de 90°
-                    # Player1 rebondit à ~135° de l'angle de collision
-                    # Player2 rebondit à ~45° de l'angle de collision
-                    # Cela garantit 90° minimum entre leurs trajectoires
-                    
-                    # Ajouter de la variabilité tout en maintenant la divergence
-                    angle_variation1 = random.uniform(-25, 25)  # ±25° de variation
-                    angle_variation2 = random.uniform(-25, 25)  # ±25° de variation
-                    
-                    # Angles de rebond divergents
-                    rebound_angle1 = collision_angle + math.pi * 0.75 + math.radians(angle_variation1)  # ~135° + variation
-                    rebound_angle2 = collision_angle + math.pi * 0.25 + math.radians(angle_variation2)  # ~45° + variation
-                    
-                    # Appliquer les nouvelles vitesses avec directions divergentes
-                    player1.vx = math.cos(rebound_angle1) * bounce_speed
-                    player1.vy = math.sin(rebound_angle1) * bounce_speed
-                    player2.vx = math.cos(rebound_angle2) * bounce_speed
-                    player2.vy = math.sin(rebound_angle2) * bounce_speed
-                    
-                    # Séparer les joueurs pour éviter l'interpénétration
-                    # Vecteur de collision normalisé
-                    nx = dx / distance
-                    ny = dy / distance
-                    
-                    overlap = min_distance - distance
-                    separation = overlap / 2
-                    
-                    player1.x -= nx * separation
-                    player1.y -= ny * separation
-                    player2.x += nx * separation
-                    player2.y += ny * separation
-    
-    def check_target_collisions(self):
-        """Vérifie si une cible touche l'extérieur du joueur (pas son centre)."""
-        for player in self.players.values():
-            # Ignorer les joueurs éliminés
-            if player.is_eliminated:
-                continue
+                # Appliquer une réduction de puissance à l'ancien propriétaire (si il y en avait un)
+                if old_owner is not None:
+                    self.players[old_owner].apply_power_reduction()
                 
-            # Vérifier la collision avec chaque cible
-            for target in self.targets.values():
-                # Calculer la distance entre le centre du joueur et la cible
-                dx = player.x - target.x
-                dy = player.y - target.y
-                distance = math.sqrt(dx * dx + dy * dy)
+                # Forcer la mise à jour de l'UI
+                self.ui_needs_update = True
                 
-                # La cible est capturée si elle touche l'extérieur du joueur
-                # Distance doit être <= rayon du joueur pour que la cible soit "à l'intérieur" du cercle du joueur
-                if distance <= player.radius:
-                    # Le joueur touche cette cible
-                    if target.owner_id != player.id:  # Si ce n'est pas déjà sa cible
-                        old_owner = target.owner_id
-                        target.set_owner(player.id)
-                        
-                        # Jouer le son de vol de ligne
-                        self.sound_manager.play_line_steal()
-                        
-                        # Ajouter des points au joueur qui a touché la cible
-                        player.add_score(1)
-                        
-                        # Appliquer une réduction de puissance à l'ancien propriétaire (si il y en avait un)
-                        if old_owner is not None:
-                            self.players[old_owner].apply_power_reduction()
-                        
-                        # Forcer la mise à jour de l'UI
-                        self.ui_needs_update = True
-                        
-                        if old_owner is not None:
-                            print(f"Joueur {player.id + 1} touche une cible du joueur {old_owner + 1} !")
-                        else:
-                            print(f"Joueur {player.id + 1} touche une cible libre !")
+                if old_owner is not None:
+                    logger.debug("Joueur %d touche une cible du joueur %d !", player.id + 1, old_owner + 1)
+                else:
+                    logger.debug("Joueur %d touche une cible libre !", player.id + 1)
     
     def check_line_crossings(self):
         """Vérifie si un joueur a franchi une ligne appartenant à un autre joueur."""
-        for player in self.players.values():
+        # Aucune ligne possédée : rien à franchir
+        if not np.any(self.target_owner >= 0):
+            return
+        
+        for player in self.players:
             # Ignorer les joueurs éliminés
             if player.is_eliminated:
                 continue
-                
-            # Vérifier le franchissement de chaque ligne (cible possédée par d'autres joueurs actifs)
-            for target in self.targets.values():
-                if (target.owner_id is not None and 
-                    target.owner_id != player.id and 
-                    not self.players[target.owner_id].is_eliminated):
-                    # Vérifier si le joueur a traversé cette ligne
-                    if self.has_crossed_line(player, target):
-                        # Le joueur franchit une ligne ennemie - il gagne la ligne
-                        old_owner = target.owner_id
-                        target.set_owner(player.id)
-                        
-                        # Jouer le son de vol de ligne
-                        self.sound_manager.play_line_steal()
-                        
-                        # Ajouter des points au joueur qui a franchi
-                        player.add_score(1)
-                        
-                        # Appliquer une réduction de puissance à l'ancien propriétaire (seulement s'il n'est pas éliminé)
-                        if old_owner is not None and not self.players[old_owner].is_eliminated:
-                            self.players[old_owner].apply_power_reduction()
-                        
-                        # Forcer la mise à jour de l'UI
-                        self.ui_needs_update = True
-                        
-                        print(f"Joueur {player.id + 1} franchit une ligne du joueur {old_owner + 1} !")
-    
-    def has_crossed_line(self, player: Player, target: Target) -> bool:
-        """Vérifie si le joueur (avec son rayon) a traversé une ligne."""
-        # Position actuelle et précédente du joueur
-        px1, py1 = player.prev_x, player.prev_y
-        px2, py2 = player.x, player.y
-        
-        # Position du propriétaire de la ligne et de la cible (ligne à traverser)
-        owner = self.players[target.owner_id]
-        ox, oy = owner.x, owner.y
-        tx, ty = target.x, target.y
-        
-        # Vérifier l'intersection entre le trajet du joueur et la ligne
-        # En tenant compte du rayon du joueur pour une détection plus sensible
-        if self.segments_intersect(px1, py1, px2, py2, ox, oy, tx, ty):
-            return True
             
-        # Vérifier aussi si le joueur est maintenant assez proche de la ligne pour la "toucher"
-        # Distance du centre du joueur à la ligne
-        distance_to_line = self.point_to_line_distance(px2, py2, ox, oy, tx, ty)
-        return distance_to_line <= player.radius
-    
-    def segments_intersect(self, x1, y1, x2, y2, x3, y3, x4, y4) -> bool:
-        """Vérifie si deux segments de droite s'intersectent."""
-        # Calcul des déterminants pour l'intersection de segments
-        denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
-        
-        if abs(denom) < 1e-10:  # Segments parallèles
-            return False
-        
-        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
-        u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denom
-        
-        # Intersection si les deux paramètres sont entre 0 et 1
-        return 0 <= t <= 1 and 0 <= u <= 1
-    
-    def point_to_line_distance(self, px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> float:
-        """Calcule la distance d'un point à un segment de ligne."""
-        # Vecteur de la ligne
-        dx = x2 - x1
-        dy = y2 - y1
-        
-        # Si la ligne est un point
-        if dx == 0 and dy == 0:
-            return math.sqrt((px - x1)**2 + (py - y1)**2)
-        
-        # Paramètre t pour la projection du point sur la ligne
-        t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
-        
-        # Limiter t entre 0 et 1 pour rester sur le segment
-        t = max(0, min(1, t))
-        
-        # Point le plus proche sur le segment
-        closest_x = x1 + t * dx
-        closest_y = y1 + t * dy
-        
-        # Distance du point au point le plus proche
-        return math.sqrt((px - closest_x)**2 + (py - closest_y)**2)
+            # Lignes possédées par d'autres joueurs actifs, testées par le noyau compilé. Les
+            # propriétaires sont relus pour chaque joueur : un vol est vu par les suivants.
+            count = _crossed_lines(player.id, float(player.radius), self.pos, self.prev,
+                                   self.target_pos, self.target_owner, self.active, self.crossed_targets)
+            
+            for target_id in self.crossed_targets[:count].tolist():
+                target = self.targets[target_id]
+                # Le joueur franchit une ligne ennemie - il gagne la ligne
+                old_owner = target.owner_id
+                target.set_owner(player.id)
+                
+                # Jouer le son de vol de ligne
+                self.sound_manager.play_line_steal()
+                
+                # Ajouter des points au joueur qui a franchi
+                player.add_score(1)
+                
+                # Appliquer une réduction de puissance à l'ancien propriétaire (seulement s'il n'est pas éliminé)
+                if old_owner is not None and not self.players[old_owner].is_eliminated:
+                    self.players[old_owner].apply_power_reduction()
+                
+                # Forcer la mise à jour de l'UI
+                self.ui_needs_update = True
+                
+                logger.debug("Joueur %d franchit une ligne du joueur %d !", player.id + 1, old_owner + 1)
     
     def update_target_ownership(self):
         """Attribution initiale d'une seule cible par joueur (seulement au début)."""
-        # Chaque joueur commence avec seulement une ligne - la cible la plus proche
-        for player_id, player in self.players.items():
-            closest_target = None
-            min_distance_sq = float('inf')
-            
-            # Trouver la cible la plus proche de ce joueur
-            for target in self.targets.values():
-                if target.owner_id is None:  # Seulement les cibles non attribuées
-                    distance_sq = (player.x - target.x) ** 2 + (player.y - target.y) ** 2
-                    if distance_sq < min_distance_sq:
-                        min_distance_sq = distance_sq
-                        closest_target = target
+        # Distances au carré joueurs × cibles en une seule diffusion (P, T)
+        offsets = self.pos.astype(np.float64)[:, None, :] - self.target_pos.astype(np.float64)[None, :, :]
+        distances_sq = np.einsum('ptk,ptk->pt', offsets, offsets)
+        
+        # Chaque joueur commence avec seulement une ligne - la cible libre la plus proche
+        # (dans l'ordre des joueurs : une cible prise n'est plus disponible pour les suivants)
+        starting_players = []
+        for player_id in range(len(self.players)):
+            free = self.target_owner < 0
+            if not free.any():
+                break
+            closest_target = int(np.where(free, distances_sq[player_id], np.inf).argmin())
             
             # Attribuer cette cible au joueur
-            if closest_target is not None:
-                closest_target.set_owner(player_id)
-                print(f"Joueur {player_id + 1} commence avec 1 ligne")
+            self.targets[closest_target].set_owner(player_id)
+            starting_players.append(str(player_id + 1))
+        
+        if starting_players:
+            print(f"Joueurs {', '.join(starting_players)} : chacun commence avec 1 ligne")
     
     def handle_events(self):
         """Gère les événements pygame."""
+        # Les types d'événements inutiles sont bloqués dans run() : la file ne contient que QUIT et KEYDOWN
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.running = False
     
     def update(self):
         """Met à jour la logique du jeu."""
         self.frame_count += 1
-        self.game_time += 1.0 / Config.FPS
+        self.game_time += self.dt
         
-        # Calcul du FPS réel
-        current_time = time.time()
-        if current_time - self.last_fps_update >= 1.0:
+        # Calcul du FPS réel (une seule lecture d'horloge monotone par frame)
+        now_ns = time.monotonic_ns()
+        if now_ns - self.last_fps_update >= 1_000_000_000:
             self.current_fps = self.frame_count
             self.frame_count = 0
-            self.last_fps_update = current_time
+            self.last_fps_update = now_ns
+        current_time = now_ns * 1e-9
         
         # Mise à jour du timer
         if not self.game_ended:
@@ -1665,18 +1965,13 @@ class BattleGame:
                 self.speed_boost_factor += 0.15
                 
                 # Appliquer l'accélération à tous les joueurs actifs
-                active_players = [p for p in self.players.values() if not p.is_eliminated]
+                active_players = [p for p in self.players if not p.is_eliminated]
                 if active_players:
                     print(f"🚀 Accélération activée ! (x{self.speed_boost_factor:.1f}) - {len(active_players)} joueurs restants")
                     
-                    for player in active_players:
-                        # Augmenter la vitesse actuelle du joueur
-                        current_speed = math.sqrt(player.vx * player.vx + player.vy * player.vy)
-                        if current_speed > 0:
-                            # Appliquer le boost de vitesse
-                            boost_factor = 1.15  # 15% d'augmentation
-                            player.vx *= boost_factor
-                            player.vy *= boost_factor
+                    # Augmenter la vitesse actuelle de tous les joueurs actifs (15%)
+                    boost_factor = 1.15
+                    self.vel[self.active] *= boost_factor
                 
                 # Forcer la mise à jour de l'UI pour montrer l'accélération
                 self.ui_needs_update = True
@@ -1695,26 +1990,22 @@ class BattleGame:
         
         # Mise à jour des joueurs avec interactions (seulement si le jeu n'est pas terminé)
         if not self.game_ended:
-            players_list = list(self.players.values())
-            for player in players_list:
-                player.update_position(1.0 / Config.FPS, players_list)
-                player.update_power_reduction()
+            # Mouvement, collisions entre joueurs et détection des cibles touchées (noyau fusionné)
+            hits = self.step_physics(self.dt)
             
-            # Gestion des collisions directes entre joueurs
-            self.handle_player_collisions()
+            self.update_power_reductions()
             
-            # Vérification des collisions avec les cibles à chaque frame
-            self.check_target_collisions()
+            # Attribution des cibles touchées à chaque frame
+            self.apply_target_hits(hits)
             
             # Vérification du franchissement des lignes à chaque frame
             self.check_line_crossings()
         
         # Mise à jour des cibles (pour les effets visuels même quand le jeu est fini)
-        for target in self.targets.values():
-            target.update_visual_effects()
+        self.update_target_effects()
         
         # Mise à jour du système de confettis
-        self.confetti_system.update(1.0 / Config.FPS)
+        self.confetti_system.update(self.dt)
         
         # Vérifier l'élimination des joueurs
         self.check_player_elimination()
@@ -1722,32 +2013,50 @@ class BattleGame:
         # Vérifier la condition de victoire
         self.check_victory_condition()
     
+    def update_target_effects(self):
+        """Décompte le clignotement de toutes les cibles, en place sur les tableaux SoA."""
+        np.greater(self.target_blink_frames, 0, out=self.target_blinking)
+        np.subtract(self.target_blink_frames, 1, out=self.target_blink_frames, where=self.target_blinking)
+    
+    def update_power_reductions(self):
+        """Décompte les réductions de puissance de tous les joueurs, en place sur les tableaux SoA."""
+        np.greater(self.power_frames, 0, out=self.power_reduced)
+        np.subtract(self.power_frames, 1, out=self.power_frames, where=self.power_reduced)
+    
     def check_player_elimination(self):
         """Vérifie et élimine les joueurs qui n'ont plus de lignes."""
-        for player in self.players.values():
+        # Nombre de lignes par joueur en une seule passe sur le tableau des propriétaires
+        owners = self.target_owner
+        owned_counts = np.bincount(owners[owners >= 0], minlength=len(self.players)).tolist()
+        for player in self.players:
             if not player.is_eliminated:
-                if player.check_elimination(self.targets):
+                if player.check_elimination(owned_counts[player.id]):
+                    self.active[player.id] = False
                     # Forcer la mise à jour de l'UI quand un joueur est éliminé
                     self.ui_needs_update = True
     
     def check_victory_condition(self):
         """Vérifie si un joueur a atteint la condition de victoire."""
-        for player in self.players.values():
+        # Victoire déjà annoncée : plus rien à vérifier
+        if self.victory_announced:
+            return
+        
+        for player in self.players:
             if player.score >= Config.CONDITION_VICTOIRE:
-                if not hasattr(self, 'victory_announced'):
-                    print(f"Joueur {player.id + 1} remporte la partie avec {player.score} points !")
-                    print("Appuyez sur Échap pour quitter ou fermez la fenêtre.")
-                    self.victory_announced = True
-                    self.game_ended = True  # Arrêter complètement le jeu
-                    # Lancer les confettis de la couleur du gagnant
-                    self.confetti_system.start_celebration(player.color, self.center_x, self.center_y)
-                self.ui_needs_update = True  # Forcer la mise à jour de l'UI
+                print(f"Joueur {player.id + 1} remporte la partie avec {player.score} points !")
+                print("Appuyez sur Échap pour quitter ou fermez la fenêtre.")
+                self.victory_announced = True
+                self.game_ended = True  # Arrêter complètement le jeu
+                # Lancer les confettis de la couleur du gagnant
+                self.confetti_system.start_celebration(player.color, self.center_x, self.center_y)
+                self.ui_needs_update = True  # Forcer la mise à jour de l'UI (une seule fois)
+                return
     
     def determine_winner_by_time(self):
         """Détermine le gagnant quand le temps est écoulé."""
-        if not hasattr(self, 'victory_announced'):
+        if not self.victory_announced:
             # Trouver le joueur avec le score le plus élevé
-            active_players = [p for p in self.players.values() if not p.is_eliminated]
+            active_players = [p for p in self.players if not p.is_eliminated]
             if active_players:
                 winner = max(active_players, key=lambda p: p.score)
                 self.winner_by_time = winner.id
@@ -1764,17 +2073,17 @@ class BattleGame:
         # Utiliser la surface précalculée
         self.screen.blit(self.background_surface, (0, 0))
     
-    def create_ui_surface(self):
-        """Crée la surface d'UI mise en cache."""
+    def create_ui_static_surface(self) -> pygame.Surface:
+        """Crée la partie fixe de l'UI (fond, séparation, titre), construite une seule fois."""
         ui_height = Config.get_ui_area_height()
-        self.ui_surface = pygame.Surface((Config.LARGEUR, ui_height))
+        surface = pygame.Surface((Config.LARGEUR, ui_height)).convert()
         
         # Zone d'interface
-        self.ui_surface.fill((20, 20, 40))
+        surface.fill((20, 20, 40))
         
         # Ligne de séparation
         pygame.draw.line(
-            self.ui_surface,
+            surface,
             Config.COULEUR_CERCLE,
             (0, ui_height - 2),
             (Config.LARGEUR, ui_height - 2),
@@ -1782,27 +2091,34 @@ class BattleGame:
         )
         
         # Titre simple
-        title_text = self.font_medium.render("BATAILLE", True, (255, 255, 255))
+        title_text = self.text_cache.render(self.font_medium, "BATAILLE", (255, 255, 255))
         title_rect = title_text.get_rect(center=(Config.LARGEUR // 2, 18))
-        self.ui_surface.blit(title_text, title_rect)
+        surface.blit(title_text, title_rect)
+        return surface
+    
+    def create_ui_surface(self):
+        """Crée la surface d'UI mise en cache : partie fixe puis timer."""
+        if self.ui_static_surface is None:
+            self.ui_static_surface = self.create_ui_static_surface()
+        if self.ui_surface is None:
+            self.ui_surface = self.ui_static_surface.copy()
+        else:
+            self.ui_surface.blit(self.ui_static_surface, (0, 0))
         
         # Affichage du timer simple
-        if hasattr(self, 'remaining_time'):
-            minutes = int(self.remaining_time // 60)
-            seconds = int(self.remaining_time % 60)
-            
-            if self.game_ended and hasattr(self, 'winner_by_time'):
-                timer_text = "TEMPS ÉCOULÉ"
-                timer_color = (255, 100, 100)
-            else:
-                timer_text = f"{minutes:02d}:{seconds:02d}"
-                timer_color = (255, 255, 100) if self.remaining_time < 30 else (200, 200, 200)
-            
-            timer_surface = self.font_small.render(timer_text, True, timer_color)
-            timer_rect = timer_surface.get_rect(center=(Config.LARGEUR // 2, 38))
-            self.ui_surface.blit(timer_surface, timer_rect)
-            
-
+        minutes = int(self.remaining_time // 60)
+        seconds = int(self.remaining_time % 60)
+        
+        if self.game_ended:
+            timer_text = "TEMPS ÉCOULÉ"
+            timer_color = (255, 100, 100)
+        else:
+            timer_text = f"{minutes:02d}:{seconds:02d}"
+            timer_color = (255, 255, 100) if self.remaining_time < 30 else (200, 200, 200)
+        
+        timer_surface = self.text_cache.render(self.font_small, timer_text, timer_color)
+        timer_rect = timer_surface.get_rect(center=(Config.LARGEUR // 2, 38))
+        self.ui_surface.blit(timer_surface, timer_rect)
         
         # Les scores sont maintenant affichés près du cercle
     
@@ -1813,34 +2129,56 @@ class BattleGame:
         start_y = 100  # Juste sous la zone UI
         spacing = 35
         
+        # Le panneau ne change qu'avec les scores ou les éliminations : réutiliser les blits sinon
+        panel_key = tuple((player.score, player.is_eliminated) for player in self.players)
+        if panel_key == self.score_panel_key:
+            self.screen.blits(self.score_panel_blits, doreturn=False)
+            return
+        
         # Trier les joueurs par score (ordre décroissant)
-        sorted_players = sorted(self.players.items(), key=lambda x: x[1].score, reverse=True)
+        sorted_players = sorted(self.players, key=lambda p: p.score, reverse=True)
         
-        for i, (player_id, player) in enumerate(sorted_players):
+        point_radius = 8
+        blits = []
+        for i, player in enumerate(sorted_players):
             y_pos = start_y + i * spacing
             
-            # Dessiner un point de couleur du joueur
-            point_radius = 8
+            # Point de couleur du joueur (pré-rastérisé)
             point_color = player.color if not player.is_eliminated else (100, 100, 100)
-            pygame.draw.circle(self.screen, point_color, (base_x, y_pos), point_radius)
-            
-            # Contour blanc pour une meilleure visibilité
-            pygame.draw.circle(self.screen, (255, 255, 255), (base_x, y_pos), point_radius, 1)
+            blits.append((self.get_score_dot_sprite(point_color, point_radius),
+                          (base_x - point_radius, y_pos - point_radius)))
             
             # Score avec la même couleur que le point
             score_text = str(player.score)
             text_color = player.color if not player.is_eliminated else (100, 100, 100)
             
-            # Rendu et affichage du texte à côté du point
-            score_surface = self.font_medium.render(score_text, True, text_color)
-            self.screen.blit(score_surface, (base_x + 20, y_pos - 10))
+            # Rendu du texte à côté du point
+            score_surface = self.text_cache.render(self.font_medium, score_text, text_color)
+            blits.append((score_surface, (base_x + 20, y_pos - 10)))
+        
+        self.score_panel_key = panel_key
+        self.score_panel_blits = blits
+        self.screen.blits(blits, doreturn=False)
+    
+    def get_score_dot_sprite(self, color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+        """Retourne le point coloré (avec contour blanc) du panneau des scores, rastérisé une seule fois."""
+        key = (color, radius)
+        sprite = self.score_dot_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            # Contour blanc pour une meilleure visibilité
+            pygame.draw.circle(sprite, (255, 255, 255), (radius, radius), radius, 1)
+            sprite = sprite.convert_alpha()
+            self.score_dot_sprites[key] = sprite
+        return sprite
     
     def draw_ui(self):
         """Dessine l'interface utilisateur optimisée."""
         # Recréer l'UI seulement si nécessaire ou toutes les secondes pour le timer
-        current_time = time.time()
+        current_time = time.monotonic()
         if (self.ui_needs_update or self.ui_surface is None or 
-            (hasattr(self, 'last_ui_update') and current_time - self.last_ui_update >= 1.0)):
+            current_time - self.last_ui_update >= 1.0):
             self.create_ui_surface()
             self.ui_needs_update = False
             self.last_ui_update = current_time
@@ -1858,13 +2196,9 @@ class BattleGame:
         # Dessiner les lignes entre joueurs et leurs cibles
         self.draw_connections()
         
-        # Ne plus dessiner les cibles (ronds) - seulement les lignes
-        # for target in self.targets.values():
-        #     target.draw(self.screen, self.players)
-        
-        # Dessiner les joueurs
-        for player in self.players.values():
-            player.draw(self.screen, self.font_small)
+        # Dessiner les joueurs (sprites pré-rastérisés, un seul appel groupé)
+        player_blits = [blit for blit in (p.get_sprite_blit() for p in self.players) if blit is not None]
+        self.screen.blits(player_blits, doreturn=False)
         
         # Dessiner les confettis
         self.confetti_system.draw(self.screen)
@@ -1876,20 +2210,22 @@ class BattleGame:
         # Dessiner l'interface utilisateur par-dessus
         self.draw_ui()
         
+        # flip() plutôt que display.update(rects) : les lignes balaient une grande partie de
+        # l'écran à chaque frame, une liste de rectangles coûterait plus cher qu'une copie complète
         pygame.display.flip()
     
     def draw_winner_popup(self):
         """Dessine la popup du vainqueur au centre du cercle."""
         # Déterminer le message du vainqueur
         winner_text = ""
-        if hasattr(self, 'winner_by_time') and self.winner_by_time is not None:
+        if self.winner_by_time is not None:
             # Victoire par temps
             winner_player = self.players[self.winner_by_time]
             winner_text = f"VAINQUEUR: {winner_player.name.upper()}"
             score_text = f"Score: {winner_player.score}"
         else:
             # Victoire par score ou élimination
-            active_players = [p for p in self.players.values() if not p.is_eliminated]
+            active_players = [p for p in self.players if not p.is_eliminated]
             if active_players:
                 winner = max(active_players, key=lambda p: p.score)
                 winner_text = f"VAINQUEUR: {winner.name.upper()}"
@@ -1917,19 +2253,19 @@ class BattleGame:
         pygame.draw.rect(popup_surface, (255, 255, 255), (0, 0, popup_width, popup_height), 3)
         
         # Texte du vainqueur
-        winner_surface = self.font_medium.render(winner_text, True, (255, 255, 100))  # Jaune
+        winner_surface = self.text_cache.render(self.font_medium, winner_text, (255, 255, 100))  # Jaune
         winner_rect = winner_surface.get_rect(center=(popup_width // 2, 30))
         popup_surface.blit(winner_surface, winner_rect)
         
         # Texte du score (si disponible)
         if score_text:
-            score_surface = self.font_small.render(score_text, True, (255, 255, 255))
+            score_surface = self.text_cache.render(self.font_small, score_text, (255, 255, 255))
             score_rect = score_surface.get_rect(center=(popup_width // 2, 60))
             popup_surface.blit(score_surface, score_rect)
         
         # Instructions
         instruction_text = "Appuyez sur Échap pour quitter"
-        instruction_surface = self.font_small.render(instruction_text, True, (200, 200, 200))
+        instruction_surface = self.text_cache.render(self.font_small, instruction_text, (200, 200, 200))
         instruction_rect = instruction_surface.get_rect(center=(popup_width // 2, 90))
         popup_surface.blit(instruction_surface, instruction_rect)
         
@@ -1938,40 +2274,62 @@ class BattleGame:
     
     def draw_connections(self):
         """Dessine les lignes de connexion entre les joueurs et leurs cibles."""
-        for target in self.targets.values():
-            if target.owner_id is not None:
-                player = self.players[target.owner_id]
-                
-                # Lignes très fines pour un effet visuel propre
-                thickness = Config.EPAISSEUR_LIGNE_NORMALE
-                if target.is_blinking:
-                    thickness = Config.EPAISSEUR_LIGNE_CONTRE_ATTAQUE
-                
-                # Couleur de la ligne
-                color = player.color
-                if target.is_blinking and (pygame.time.get_ticks() // 100) % 2 == 0:
-                    color = Config.COULEUR_CONTRE_ATTAQUE
-                
-                # Dessiner la ligne du joueur vers sa cible
-                pygame.draw.line(
-                    self.screen,
-                    color,
-                    (int(player.x), int(player.y)),
-                    (int(target.x), int(target.y)),
-                    thickness
-                )
+        draw_line = pygame.draw.line
+        screen = self.screen
+        # Constantes de style lues une fois hors de la boucle (lookups d'attributs de classe)
+        normal_thickness = Config.EPAISSEUR_LIGNE_NORMALE
+        counter_thickness = Config.EPAISSEUR_LIGNE_CONTRE_ATTAQUE
+        counter_color = Config.COULEUR_CONTRE_ATTAQUE
+        target_pixels = self.target_pixels
+        # Coordonnées entières des joueurs converties en un seul appel, phase de clignotement lue une fois
+        player_pixels = self.pos.astype(np.int32).tolist()
+        player_colors = [player.color for player in self.players]
+        blink_on = (pygame.time.get_ticks() // 100) % 2 == 0
+        
+        # Seules les connexions existantes : (cible, propriétaire, clignotement) lus dans les tableaux
+        owned = np.flatnonzero(self.target_owner >= 0)
+        connections = zip(owned.tolist(), self.target_owner[owned].tolist(), self.target_blinking[owned].tolist())
+        
+        for target_id, owner_id, blinking in connections:
+            # Ligne de longueur nulle (joueur sur sa cible) : entièrement cachée par le joueur
+            start = player_pixels[owner_id]
+            end = target_pixels[target_id]
+            if start[0] == end[0] and start[1] == end[1]:
+                continue
+            
+            # Lignes très fines pour un effet visuel propre, plus épaisses et alternées en contre-attaque
+            if blinking:
+                thickness = counter_thickness
+                color = counter_color if blink_on else player_colors[owner_id]
+            else:
+                thickness = normal_thickness
+                color = player_colors[owner_id]
+            
+            # Dessiner la ligne du joueur vers sa cible
+            draw_line(screen, color, start, end, thickness)
     
     def run(self):
         """Boucle principale du jeu."""
         print("Démarrage de la boucle de jeu...")
         
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            
-            # Maintenir 60 FPS
-            self.clock.tick(Config.FPS)
+        # Seuls QUIT et KEYDOWN intéressent le jeu : les autres types (souris, fenêtre...) ne sont
+        # plus du tout mis en file, il n'y a donc rien à vider à chaque frame
+        blocked = [event_type for event_type in range(pygame.NUMEVENTS) if pygame.event.get_blocked(event_type)]
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed((pygame.QUIT, pygame.KEYDOWN))
+        
+        try:
+            while self.running:
+                self.handle_events()
+                self.update()
+                self.draw()
+                
+                # Maintenir 60 FPS
+                self.clock.tick(Config.FPS)
+        finally:
+            # Rétablir le filtrage global d'avant la partie (l'écran de configuration a besoin des clics)
+            pygame.event.set_allowed(None)
+            pygame.event.set_blocked(blocked)
         
         pygame.quit()
         print("Jeu terminé.")